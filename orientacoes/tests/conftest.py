@@ -0,0 +1,34 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "importador-xml-di-nf-entrada-perplexity-aprimorado-venda.py"
+
+
+@pytest.fixture(scope="session")
+def extrato():
+    """O script do importador carregado como módulo (o nome do arquivo tem hífens)"""
+    if "extrato_di" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("extrato_di", SCRIPT)
+        modulo = importlib.util.module_from_spec(spec)
+        sys.modules["extrato_di"] = modulo
+        spec.loader.exec_module(modulo)
+    return sys.modules["extrato_di"]
+
+
+@pytest.fixture
+def xml_di(extrato, tmp_path):
+    """XML de uma DI sintética pequena (3 adições x 4 itens)"""
+    caminho = tmp_path / "di.xml"
+    caminho.write_text(extrato.gerar_xml_di_sintetico(3, 4, semente=7), encoding="utf-8")
+    return caminho
+
+
+@pytest.fixture
+def dados_di(extrato, xml_di):
+    """DI sintética carregada e com custos calculados"""
+    dados = extrato.carrega_di_completo(xml_di)
+    extrato.calcular_custos_unitarios(dados, silencioso=True)
+    return dados
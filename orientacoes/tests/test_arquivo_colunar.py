@@ -0,0 +1,61 @@
+import json
+import math
+
+import pytest
+
+
+def _normalizar(valor):
+    """Registros viram dicts e NaN vira texto, para comparar a DI original com a recarregada"""
+    if hasattr(valor, "items"):
+        return {chave: _normalizar(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, float) and math.isnan(valor):
+        return "nan"
+    return valor
+
+
+def _json(dados):
+    return json.loads(json.dumps(_normalizar(dados), default=str))
+
+
+def test_salvar_e_carregar_di(extrato, dados_di, tmp_path):
+    dados_di["validacao_custos"] = extrato.validar_custos(dados_di)
+    arquivo = extrato.ArquivoColunarDIs(tmp_path / "arquivo")
+    arquivo.salvar_di(dados_di)
+
+    recarregada = arquivo.carregar_di(dados_di["cabecalho"]["DI"])
+
+    assert _json(recarregada) == _json(dados_di)
+    assert list(recarregada) == list(dados_di)
+    assert list(recarregada["adicoes"][0]["itens"][0]) == list(dados_di["adicoes"][0]["itens"][0])
+
+
+def test_di_sem_custos_e_campo_parcial(extrato, xml_di, tmp_path):
+    dados = extrato.carrega_di_completo(xml_di)
+    dados["adicoes"][0]["itens"][0]["Observação"] = {"lote": [1, 2]}
+    arquivo = extrato.ArquivoColunarDIs(tmp_path / "arquivo")
+    arquivo.salvar_di(dados)
+
+    recarregada = arquivo.carregar_di(dados["cabecalho"]["DI"])
+
+    assert _json(recarregada["adicoes"]) == _json(dados["adicoes"])
+    assert "custos" not in recarregada["adicoes"][0]
+    assert "Observação" not in recarregada["adicoes"][0]["itens"][1]
+
+
+def test_colunas_somas_e_exclusao(extrato, dados_di, tmp_path):
+    arquivo = extrato.ArquivoColunarDIs(tmp_path / "arquivo")
+    arquivo.salvar_di(dados_di)
+    numero_di = dados_di["cabecalho"]["DI"]
+    itens = [item for adicao in dados_di["adicoes"] for item in adicao["itens"]]
+
+    assert arquivo.listar_dis() == [{"DI": numero_di, "Qtd. adições": 3, "Itens": 12}]
+    assert arquivo.coluna(numero_di, "Código") == [item["Código"] for item in itens]
+    totais = arquivo.somar(["Custo Total Item R$", "Qtd"])
+    assert totais["Custo Total Item R$"] == pytest.approx(sum(item["Custo Total Item R$"] for item in itens))
+    assert totais["Qtd"] == pytest.approx(sum(item["Qtd"] for item in itens))
+
+    arquivo.excluir_di(numero_di)
+    assert arquivo.carregar_di(numero_di) is None
+    assert arquivo.listar_dis() == []
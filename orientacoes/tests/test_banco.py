@@ -0,0 +1,30 @@
+def test_carregar_di_reconstroi_a_di_gravada(extrato, dados_di, tmp_path):
+    with extrato.BancoDIsSQLite(tmp_path / "banco.sqlite3") as banco:
+        numero_di = banco.salvar_di(dados_di)
+        recarregada = banco.carregar_di(numero_di)
+
+    assert recarregada["cabecalho"] == dados_di["cabecalho"]
+    for adicao, original in zip(recarregada["adicoes"], dados_di["adicoes"]):
+        assert dict(adicao["dados_gerais"]) == dict(original["dados_gerais"])
+        assert adicao["custos"] == original["custos"]
+        assert [dict(item) for item in adicao["itens"]] == [dict(item) for item in original["itens"]]
+        assert list(adicao["itens"][0]) == list(original["itens"][0])
+
+
+def test_carregar_di_sem_custos(extrato, xml_di, tmp_path):
+    dados = extrato.carrega_di_completo(xml_di)
+    with extrato.BancoDIsSQLite(tmp_path / "banco.sqlite3") as banco:
+        recarregada = banco.carregar_di(banco.salvar_di(dados))
+
+    adicao = recarregada["adicoes"][0]
+    assert "custos" not in adicao
+    assert "Custo Total Item R$" not in adicao["itens"][0]
+    assert [dict(item) for item in adicao["itens"]] == [dict(item) for item in dados["adicoes"][0]["itens"]]
+
+
+def test_benchmark_mede_recarga_sqlite(extrato, tmp_path):
+    relatorio = extrato.executar_benchmark((5,), itens_por_adicao=3, baseline=tmp_path / "baseline.json",
+                                           gerar_excel=False)
+    etapas = relatorio["resultados"]["5x3"]
+    assert etapas["carregar_di_sqlite"] > 0
+    assert "carrega_di_completo" in etapas
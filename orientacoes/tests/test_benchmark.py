@@ -0,0 +1,22 @@
+import json
+
+
+def test_benchmark_grava_baseline_e_detecta_regressao(extrato, tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    relatorio = extrato.executar_benchmark((2,), 2, baseline=baseline)
+
+    etapas = relatorio["resultados"]["2x2"]
+    assert {"carrega_di_completo", "calcular_custos_unitarios", "gera_excel_completo",
+            "carregar_di_sqlite"} <= set(etapas)
+    assert relatorio["regressoes"] == []
+    gravado = json.loads(baseline.read_text(encoding="utf-8"))
+    assert gravado["resultados"] == relatorio["resultados"]
+
+    # Baseline impossível de atingir: toda etapa vira regressão
+    gravado["resultados"]["2x2"] = dict.fromkeys(etapas, 1e-9)
+    baseline.write_text(json.dumps(gravado), encoding="utf-8")
+    relatorio = extrato.executar_benchmark((2,), 2, baseline=baseline, tolerancia_s=0.0)
+
+    assert {regressao["etapa"] for regressao in relatorio["regressoes"]} == set(etapas)
+    assert json.loads(baseline.read_text(encoding="utf-8"))["resultados"]["2x2"]["gera_excel_completo"] == 1e-9
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+
+def test_obter_async_coalesce_chamadas_concorrentes(extrato):
+    cache = extrato.CacheCalculos()
+    chamadas = []
+
+    async def calcular():
+        chamadas.append(1)
+        await asyncio.sleep(0.01)
+        return {"preco": 42}
+
+    async def principal():
+        return await asyncio.gather(*(cache.obter_async("di", calcular) for _ in range(10)))
+
+    resultados = asyncio.run(principal())
+
+    assert len(chamadas) == 1
+    assert all(resultado is resultados[0] for resultado in resultados)
+    metricas = cache.metricas()
+    assert (metricas["faltas"], metricas["coalescidas"], metricas["acertos"]) == (1, 9, 0)
+    assert cache.consultar("di") == {"preco": 42}
+
+
+def test_obter_async_propaga_erro_sem_guardar(extrato):
+    cache = extrato.CacheCalculos()
+    chamadas = []
+
+    async def calcular():
+        chamadas.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("XML inválido")
+
+    async def principal():
+        return await asyncio.gather(*(cache.obter_async("di", calcular) for _ in range(3)),
+                                    return_exceptions=True)
+
+    erros = asyncio.run(principal())
+
+    assert len(chamadas) == 1
+    assert all(isinstance(erro, ValueError) for erro in erros)
+    assert len(cache) == 0
+    # Sem resultado em cache nem cálculo pendente: a próxima chamada recalcula
+    with pytest.raises(ValueError):
+        asyncio.run(cache.obter_async("di", calcular))
+    assert len(chamadas) == 2
+
+
+def test_ttl_e_lru(extrato):
+    agora = [0.0]
+    cache = extrato.CacheCalculos(max_itens=2, ttl_s=10, relogio=lambda: agora[0])
+    cache.obter("a", lambda: 1)
+    cache.obter("b", lambda: 2)
+    cache.obter("a", lambda: 0)
+    cache.obter("c", lambda: 3)  # descarta "b", o menos usado
+
+    assert cache.consultar("b") is None
+    assert cache.consultar("a") == 1
+    agora[0] = 10.0
+    assert cache.consultar("a") is None
+    assert cache.metricas()["expiradas"] >= 1
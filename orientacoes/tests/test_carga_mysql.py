@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+
+TABELAS = ["importadores", "fornecedores", "fabricantes", "declaracoes_importacao", "adicoes", "mercadorias",
+           "tributos", "despesas_aduaneiras"]
+
+
+@pytest.fixture
+def xmls(extrato, tmp_path):
+    caminhos = []
+    for i, numero_di in enumerate(["2500000001", "2500000002", "2500000003"]):
+        caminho = tmp_path / f"DI_{numero_di}.xml"
+        caminho.write_text(extrato.gerar_xml_di_sintetico(2 + i, 3, semente=i, numero_di=numero_di),
+                           encoding="utf-8")
+        caminhos.append(caminho)
+    return caminhos
+
+
+def _conteudo(banco):
+    """Linhas de cada tabela, sem ids e datas gerados na gravação"""
+    conexao = sqlite3.connect(str(banco))
+    conteudo = {}
+    for tabela in TABELAS:
+        cursor = conexao.execute(f"SELECT * FROM {tabela}")
+        colunas = [descricao[0] for descricao in cursor.description]
+        manter = [i for i, coluna in enumerate(colunas)
+                  if coluna != "id" and not coluna.endswith(("_id", "_at"))]
+        conteudo[tabela] = sorted(tuple(linha[i] for i in manter) for linha in cursor)
+    conexao.close()
+    return conteudo
+
+
+def test_recarga_idempotente(extrato, xmls, tmp_path):
+    banco = tmp_path / "carga.sqlite3"
+    with extrato.CarregadorMySQL.sqlite(banco, dis_por_lote=2) as carregador:
+        primeira = carregador.carregar(xmls)
+    antes = _conteudo(banco)
+
+    # Mesmas DIs de novo, em outra ordem e com uma DI repetida no mesmo lote
+    with extrato.CarregadorMySQL.sqlite(banco, dis_por_lote=2) as carregador:
+        segunda = carregador.carregar([xmls[2], xmls[0], xmls[0], xmls[1]])
+
+    assert primeira["erros"] == segunda["erros"] == []
+    assert primeira["dis"] == 3
+    assert _conteudo(banco) == antes
+    assert len(antes["declaracoes_importacao"]) == 3
+    assert len(antes["adicoes"]) == 2 + 3 + 4
+    assert len(antes["mercadorias"]) == (2 + 3 + 4) * 3
+
+
+def test_xml_invalido_nao_interrompe_carga(extrato, xmls, tmp_path):
+    invalido = tmp_path / "invalido.xml"
+    invalido.write_text("<ListaDeclaracoes>", encoding="utf-8")
+
+    with extrato.CarregadorMySQL.sqlite(tmp_path / "carga.sqlite3") as carregador:
+        relatorio = carregador.carregar([xmls[0], invalido, xmls[1]])
+
+    assert relatorio["dis"] == 2
+    assert [erro["xml"] for erro in relatorio["erros"]] == [str(invalido)]
+
+
+def test_lotes_paralelos_nao_duplicam_fornecedores(extrato, xmls, tmp_path):
+    # Mesmo fornecedor/fabricante com outra grafia: o banco compara sem maiúsculas/acentos
+    xmls[1].write_text(xmls[1].read_text(encoding="utf-8")
+                       .replace("FORNECEDOR 0", "Fornecedor 0").replace("FABRICANTE 1", "FABRICANTÉ 1"),
+                       encoding="utf-8")
+    banco = tmp_path / "carga.sqlite3"
+    with extrato.CarregadorMySQL.sqlite(banco, tamanho_pool=4, dis_por_lote=1) as carregador:
+        relatorio = carregador.carregar(xmls)
+
+    assert relatorio["erros"] == []
+    conexao = sqlite3.connect(str(banco))
+    for tabela in ("fornecedores", "fabricantes"):
+        nomes = [nome for (nome,) in conexao.execute(f"SELECT nome FROM {tabela}")]
+        assert len({extrato._chave_nome_dimensao(nome) for nome in nomes}) == len(nomes)
+    assert conexao.execute("SELECT COUNT(*) FROM adicoes WHERE fornecedor_id IS NULL "
+                           "OR fabricante_id IS NULL").fetchone()[0] == 0
+    conexao.close()
@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.fixture
+def custos_sem_primeira_adicao(extrato, monkeypatch):
+    """calcular_custos_unitarios que deixa a primeira adição sem custos"""
+    original = extrato.calcular_custos_unitarios
+
+    def calcular(dados, **parametros):
+        original(dados, **parametros)
+        del dados["adicoes"][0]["custos"]
+
+    monkeypatch.setattr(extrato, "calcular_custos_unitarios", calcular)
+
+
+def test_consolidar_dis_ignora_adicao_sem_custos(extrato, xml_di, custos_sem_primeira_adicao):
+    resultado = extrato.consolidar_dis([xml_di], workers=0)
+
+    assert resultado["erros"] == []
+    linha = resultado["dis"][0]
+    assert linha["Adições"] == 2
+    assert linha["Itens"] == 8
+    assert linha["Diagnósticos"] == 1
+
+
+def test_processar_di_registra_adicao_sem_custos(extrato, xml_di, custos_sem_primeira_adicao):
+    dados = extrato.processar_di(xml_di, silencioso=True)
+
+    adicao = dados["adicoes"][0]
+    assert dados["diagnosticos"] == [{"Etapa": extrato.ETAPA_CUSTOS, "Adição": adicao["numero"], "Item": None,
+                                      "Erro": "adição sem custos calculados"}]
+    assert adicao["dados_gerais"]["Situação Processamento"] == extrato.SITUACAO_ADICAO_INCOMPLETA
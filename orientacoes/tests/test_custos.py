@@ -0,0 +1,11 @@
+def test_configuracao_especial_ativa_aparece_no_resumo(extrato, xml_di):
+    dados = extrato.carrega_di_completo(xml_di)
+    config = extrato.CONFIGURACOES_ESPECIAIS_DEFAULT.substituir("reducao_base_entrada", ativo=True, percentual=70.0)
+
+    extrato.calcular_custos_unitarios(dados, configuracoes_especiais=config, silencioso=True)
+
+    assert dados["configuracao_custos"]["Configurações Especiais Ativas"] == ["reducao_base_entrada"]
+
+
+def test_sem_configuracoes_ativas(dados_di):
+    assert dados_di["configuracao_custos"]["Configurações Especiais Ativas"] == []
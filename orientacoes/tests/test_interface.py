@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SCRIPT
+
+
+def test_import_nao_carrega_tkinter():
+    # Workers do monitor/servidor importam o script: o Tk só deve ser carregado ao abrir a interface
+    codigo = ("import importlib.util, sys\n"
+              f"spec = importlib.util.spec_from_file_location('extrato_di', {str(SCRIPT)!r})\n"
+              "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+              "print('tkinter' in sys.modules)\n")
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    assert saida.stdout.strip() == "False"
+
+
+def test_app_extrato_combina_interface_e_tk(extrato):
+    tk = extrato._carregar_tk()
+    if tk is None:
+        pytest.skip("tkinter não está disponível")
+    assert issubclass(extrato.AppExtrato, tk.Tk)
+    assert issubclass(extrato.AppExtrato, extrato._InterfaceExtrato)
@@ -0,0 +1,47 @@
+import hashlib
+
+
+def _hash(caminho):
+    return hashlib.sha256(caminho.read_bytes()).hexdigest()
+
+
+def test_journal_erro_volta_a_ser_pendente(extrato, tmp_path):
+    with extrato.JournalIngestao(tmp_path / "journal.db", max_tentativas=2, espera_s=0) as journal:
+        journal.registrar("h1", "a.xml", 10, 100, "erro", erro="OSError: arquivo bloqueado")
+        assert journal.pendente("h1")
+        assert not journal.arquivo_conhecido("a.xml", 10, 100)
+
+        # Tentativas esgotadas: não volta mais à fila
+        journal.registrar("h1", "a.xml", 10, 100, "erro", erro="OSError: arquivo bloqueado")
+        assert journal.registros()[0]["tentativas"] == 2
+        assert not journal.pendente("h1")
+        assert journal.arquivo_conhecido("a.xml", 10, 100)
+
+        journal.registrar("h2", "b.xml", 10, 100, "ok")
+        assert not journal.pendente("h2")
+        assert journal.arquivo_conhecido("b.xml", 10, 100)
+        assert journal.pendente("desconhecido")
+
+
+def test_journal_respeita_espera_entre_tentativas(extrato, tmp_path):
+    with extrato.JournalIngestao(tmp_path / "journal.db", espera_s=3600) as journal:
+        journal.registrar("h1", "a.xml", 10, 100, "erro", erro="timeout")
+        assert not journal.pendente("h1")
+        assert journal.arquivo_conhecido("a.xml", 10, 100)
+
+
+def test_monitor_reprocessa_xml_que_falhou(extrato, xml_di, tmp_path):
+    entrada = xml_di.parent
+    info = xml_di.stat()
+    journal = extrato.JournalIngestao(tmp_path / "journal.db", espera_s=0)
+    # Falha transitória de uma execução anterior do monitor
+    journal.registrar(_hash(xml_di), xml_di, info.st_mtime_ns, info.st_size, "erro", erro="OSError: bloqueado")
+
+    monitor = extrato.MonitorPastaDIs(entrada, tmp_path / "saida", workers=1, intervalo_s=0.05, journal=journal)
+    estatisticas = monitor.executar(ciclos=2)
+
+    assert estatisticas["processados"] == 1
+    assert estatisticas["duplicados"] == 0
+    assert journal.status(_hash(xml_di)) in extrato.STATUS_INGESTAO_CONCLUIDOS
+    assert journal.registros()[0]["tentativas"] == 0
+    journal.fechar()
@@ -0,0 +1,26 @@
+import pytest
+
+
+def test_nfe_valida_no_xsd(extrato, dados_di, tmp_path):
+    pytest.importorskip("lxml")
+    notas = extrato.gerar_nfe_importacao(dados_di, tmp_path / "nfe", uf="SC", limite_itens=5)
+
+    assert [nota["itens"] for nota in notas] == [5, 5, 2]
+    assert all(nota["erros_xsd"] == [] for nota in notas)
+
+
+def test_nfe_rejeita_adicao_acima_de_999(extrato, dados_di, tmp_path):
+    dados_di["adicoes"][-1]["numero"] = "1000"
+
+    with pytest.raises(ValueError, match="nAdicao"):
+        extrato.gerar_nfe_importacao(dados_di, tmp_path / "nfe", uf="SC", validar=False)
+    assert not (tmp_path / "nfe").exists()
+
+
+def test_nfe_invalida_no_xsd_levanta_erro(extrato, dados_di, tmp_path):
+    pytest.importorskip("lxml")
+
+    with pytest.raises(extrato.ErroValidacaoNFe) as erro:
+        extrato.gerar_nfe_importacao(dados_di, tmp_path / "nfe", uf="SC", emitente={"CRT": "9"})
+    assert len(erro.value.notas) == 1
+    assert any("CRT" in mensagem for mensagem in erro.value.notas[0]["erros_xsd"])
@@ -0,0 +1,27 @@
+import json
+
+
+def test_processar_di_gera_excel_e_perfil(extrato, xml_di, tmp_path):
+    xlsx = tmp_path / "di.xlsx"
+
+    dados = extrato.processar_di(xml_di, xlsx, precificacao={}, silencioso=True)
+
+    assert xlsx.stat().st_size > 0
+    etapas = [etapa["etapa"] for etapa in dados["perfil_execucao"]["etapas"]]
+    assert etapas == ["carrega_di_completo", "calcular_custos_unitarios", "validar_custos", "precificacao",
+                      "gera_excel_completo"]
+    perfil = json.loads(xlsx.with_suffix(".perfil.json").read_text(encoding="utf-8"))
+    assert [etapa["etapa"] for etapa in perfil["etapas"]] == etapas
+
+
+def test_excel_com_diagnosticos(extrato, dados_di, tmp_path):
+    import zipfile
+
+    extrato.registrar_diagnostico(dados_di, extrato.ETAPA_CUSTOS, ValueError("Qtd inválida"),
+                                  dados_di["adicoes"][1]["numero"])
+    xlsx = tmp_path / "di.xlsx"
+
+    extrato.gera_excel_completo(dados_di, xlsx)
+
+    with zipfile.ZipFile(xlsx) as pacote:
+        assert 'name="05B_Diagnosticos"' in pacote.read("xl/workbook.xml").decode("utf-8")
@@ -0,0 +1,53 @@
+import pytest
+
+
+def _pares_adicao_item(dados):
+    return [(adicao, item) for adicao in dados["adicoes"] for item in adicao["itens"]]
+
+
+def test_simulacao_usa_aliquota_ipi_em_fracao(extrato, dados_di):
+    simulacao = extrato.simular_cenarios_cambio_frete(dados_di, n_cenarios=3, volatilidade_cambio=0.0,
+                                                      volatilidade_frete=0.0, volatilidade_afrmm=0.0, semente=1)
+
+    pares = _pares_adicao_item(dados_di)
+    assert any(adicao["tributos"]["IPI Alíq. (%)"] > 0 for adicao, _ in pares)
+    for (adicao, item), linha in zip(pares, simulacao["itens"]):
+        _, custo_liquido = extrato.calcular_creditos_tributarios(item)
+        esperado = extrato.calcular_preco_venda(custo_liquido, 0.30, 0.19, adicao["tributos"]["IPI Alíq. (%)"])
+        assert linha["Preço Final P50 R$"] * item["Qtd"] == pytest.approx(esperado["Preço Final R$"], rel=1e-5)
+
+
+def test_simulacao_nao_credita_icms_st(extrato, dados_di):
+    # ST incorporada ao custo de um item (sem crédito, como em calcular_creditos_tributarios)
+    item = dados_di["adicoes"][0]["itens"][0]
+    item["ICMS-ST Incorporado R$"] = 150.0
+    item["Custo Total Item R$"] += 150.0
+
+    simulacao = extrato.simular_cenarios_cambio_frete(dados_di, n_cenarios=3, volatilidade_cambio=0.0,
+                                                      volatilidade_frete=0.0, volatilidade_afrmm=0.0, semente=1)
+
+    _, custo_liquido = extrato.calcular_creditos_tributarios(item)
+    esperado = extrato.calcular_preco_venda(custo_liquido, 0.30, 0.19,
+                                            dados_di["adicoes"][0]["tributos"]["IPI Alíq. (%)"])
+    linha = simulacao["itens"][0]
+    assert linha["Preço Final P50 R$"] * item["Qtd"] == pytest.approx(esperado["Preço Final R$"], rel=1e-5)
+    assert linha["Custo Unit. P50 R$"] * item["Qtd"] == pytest.approx(item["Custo Total Item R$"], rel=1e-5)
+
+
+def test_precificar_itens_usa_aliquota_ipi_em_fracao(extrato, dados_di):
+    precos = extrato.precificar_itens(dados_di)
+
+    for (adicao, _), preco in zip(_pares_adicao_item(dados_di), precos):
+        assert preco["precificacao"]["IPI Alíq. Venda (%)"] == pytest.approx(
+            adicao["tributos"]["IPI Alíq. (%)"] * 100)
+
+
+def test_matriz_uf_usa_aliquota_ipi_em_fracao(extrato, dados_di):
+    tabela = extrato.carregar_tabela_aliquotas_icms()
+    matriz = extrato.calcular_matriz_precos_uf(dados_di, "SC", ["SC", "SP"], tabela=tabela)
+
+    aliq_interna = tabela["ufs"]["SC"]["aliquota"]
+    for (adicao, item), linha, precos in zip(_pares_adicao_item(dados_di), matriz["itens"], matriz["precos"]):
+        esperado = extrato.calcular_preco_venda(linha["Custo Líquido Unit. R$"], 0.30, aliq_interna,
+                                                adicao["tributos"]["IPI Alíq. (%)"])
+        assert precos[0] == pytest.approx(esperado["Preço Final R$"])
@@ -0,0 +1,81 @@
+import pytest
+
+
+@pytest.fixture
+def tabela(extrato, tmp_path):
+    with extrato.TabelaPTAX(tmp_path / "ptax.sqlite3") as tabela:
+        yield tabela
+
+
+def test_arquivo_bcb_com_dias_19_e_20(tabela, tmp_path):
+    csv = tmp_path / "bcb.csv"
+    csv.write_text(
+        "17012025;220;A;USD;6,0500;6,0506;1,0000;1,0000\n"
+        "19012025;220;A;USD;6,0700;6,0706;1,0000;1,0000\n"
+        "20012025;220;A;USD;6,0800;6,0806;1,0000;1,0000\n"
+        "21012025;220;A;USD;6,0900;6,0906;1,0000;1,0000\n", encoding="utf-8")
+
+    assert tabela.importar_csv(csv) == 4
+    assert tabela.moedas()["220"] == ("20250117", "20250121", 4)
+    assert tabela.taxa("220", "20250120") == pytest.approx(6.0806)
+    assert tabela.taxa("220", "20250119", tipo="compra") == pytest.approx(6.07)
+    assert tabela.taxa("220", "20250118") == pytest.approx(6.0506)  # último dia anterior com cotação
+    assert tabela.taxa("220", "20250116") is None
+
+
+def test_csv_com_cabecalho_iso_e_barras(tabela, tmp_path):
+    csv = tmp_path / "ptax.csv"
+    csv.write_text("data;moeda;taxa_venda\n2025-01-20;USD;6,08\n21/01/2025;USD;6,09\n", encoding="utf-8")
+
+    tabela.importar_csv(csv)
+
+    assert tabela.taxa("220", "2025-01-20") == pytest.approx(6.08)
+    assert tabela.taxa("220", "20250121") == pytest.approx(6.09)
+
+
+@pytest.mark.parametrize("valor, ddmmyyyy, esperado", [
+    ("20250120", False, "20250120"),
+    ("20012025", True, "20250120"),
+    ("19012025", True, "20250119"),
+    ("2025-01-20", False, "20250120"),
+    ("20/1/2025", False, "20250120"),
+])
+def test_normalizar_data_ptax(extrato, valor, ddmmyyyy, esperado):
+    assert extrato._normalizar_data_ptax(valor, ddmmyyyy) == esperado
+
+
+@pytest.mark.parametrize("valor", ["20012025", "2025-13-01", "abc"])
+def test_data_ptax_invalida(extrato, valor):
+    with pytest.raises(ValueError):
+        extrato._normalizar_data_ptax(valor)
+
+
+def test_arquivo_bcb_com_moeda_fora_da_tabela(tabela, tmp_path):
+    csv = tmp_path / "bcb.csv"
+    csv.write_text("20012025;005;A;AFN;0,0800;0,0810;76,0000;76,5000\n"
+                   "20012025;220;A;USD;6,0800;6,0806;1,0000;1,0000\n", encoding="utf-8")
+
+    assert tabela.importar_csv(csv) == 2
+    assert tabela.taxa("005", "20250120") == pytest.approx(0.081)
+    assert tabela.taxa("220", "20250120") == pytest.approx(6.0806)
+
+
+def test_csv_com_sigla_desconhecida_e_ignorado(tabela, tmp_path, caplog):
+    csv = tmp_path / "ptax.csv"
+    csv.write_text("data;moeda;taxa_venda\n20/01/2025;XYZ;1,5\n20/01/2025;USD;6,08\n", encoding="utf-8")
+
+    assert tabela.importar_csv(csv) == 1
+    assert "1 linha(s) ignorada(s)" in caplog.text and "XYZ" in caplog.text
+
+
+def test_di_sem_data_de_registro_mantem_taxa_da_di(extrato, tabela, dados_di, tmp_path):
+    csv = tmp_path / "bcb.csv"
+    csv.write_text("20012025;220;A;USD;9,0000;9,0000;1,0000;1,0000\n", encoding="utf-8")
+    tabela.importar_csv(csv)
+    dados_di["cabecalho"]["Data registro"] = "N/A"
+
+    taxas = extrato.resolver_taxas_cambio(dados_di, tabela_ptax=tabela)
+
+    assert all(adicao["taxa"] == adicao["taxa_di"] for adicao in taxas["adicoes"])
+    assert dados_di["diagnosticos"][-1]["Etapa"] == extrato.ETAPA_CUSTOS
+    assert "PTAX não aplicada" in dados_di["diagnosticos"][-1]["Erro"]
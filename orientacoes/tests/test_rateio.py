@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+
+def test_ratear_centavos_soma_exata_escalar(extrato):
+    partes = extrato.ratear_centavos(100, [1, 1, 1])
+
+    assert partes.tolist() == [34, 33, 33]
+    assert partes.sum() == 100
+
+
+def test_ratear_centavos_por_grupo(extrato):
+    rng = np.random.default_rng(3)
+    grupos = np.repeat(np.arange(50), rng.integers(1, 20, 50))
+    pesos = rng.uniform(0, 1000, len(grupos))
+    totais = rng.integers(-10**9, 10**9, (4, 50))
+
+    partes = extrato.ratear_centavos(totais, pesos, grupos)
+
+    somas = np.zeros_like(totais)
+    for g in range(50):
+        somas[:, g] = partes[:, grupos == g].sum(axis=1)
+    assert (somas == totais).all()
+    # Cada parte fica a menos de um centavo da divisão proporcional
+    fracao = pesos / np.bincount(grupos, weights=pesos)[grupos]
+    assert np.abs(partes - totais[:, grupos] * fracao).max() < 1
+
+
+@pytest.mark.parametrize("pesos, esperado", [([0, 0], [[0, 0]]), ([0, 5], [[0, 1001]])])
+def test_ratear_centavos_grupo_sem_peso_recebe_zero(extrato, pesos, esperado):
+    assert extrato.ratear_centavos([[7, 1001]], pesos, [0, 1]).tolist() == esperado
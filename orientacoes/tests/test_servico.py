@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import pytest
+
+
+async def _requisitar(porta, bruto):
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    escritor.write(bruto)
+    await escritor.drain()
+    linha_status = await leitor.readline()
+    cabecalhos = {}
+    while (linha := await leitor.readline()) not in (b"\r\n", b""):
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    corpo = await leitor.readexactly(int(cabecalhos["content-length"]))
+    escritor.close()
+    return int(linha_status.split()[1]), json.loads(corpo) if corpo else None
+
+
+def _executar(extrato, *requisicoes):
+    """Sobe o serviço (sem pool de processos) numa porta livre e envia as requisições brutas em ordem"""
+    async def principal():
+        servico = extrato.ServicoCalculoDI(workers=0)
+        _, porta = await servico.iniciar("127.0.0.1", 0)
+        try:
+            return [await _requisitar(porta, bruto) for bruto in requisicoes]
+        finally:
+            await servico.encerrar()
+    return asyncio.run(principal())
+
+
+def _post(alvo, corpo, tipo="application/xml"):
+    return (f"POST {alvo} HTTP/1.1\r\nHost: x\r\nContent-Type: {tipo}\r\nContent-Length: {len(corpo)}\r\n"
+            f"Connection: close\r\n\r\n").encode("latin-1") + corpo
+
+
+def test_preco_com_parametros_na_query_string(extrato, xml_di):
+    xml = xml_di.read_bytes()
+    [(status_30, preco_30), (status_50, preco_50)] = _executar(
+        extrato, _post("/preco?margem=0.3&regime=real", xml), _post("/preco?margem=0.5&regime=real", xml))
+
+    assert status_30 == status_50 == 200
+    assert len(preco_30["itens"]) == len(preco_50["itens"]) == 12
+    final_30, final_50 = (preco["itens"][0]["precificacao"]["Preço Final R$"] for preco in (preco_30, preco_50))
+    assert final_50 > final_30
+
+
+def test_preco_com_parametros_json(extrato):
+    [(status, preco)] = _executar(extrato, _post("/preco", json.dumps(
+        {"custo_liquido": 100.0, "margem": 0.3}).encode(), "application/json"))
+
+    assert status == 200
+    assert preco["Preço Final R$"] > 100.0
+
+
+def test_content_length_invalido_responde_400(extrato):
+    bruto = b"POST /preco HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n"
+    [(status, resposta)] = _executar(extrato, bruto)
+
+    assert status == 400
+    assert "Content-Length" in resposta["erro"]